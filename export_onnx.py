@@ -0,0 +1,62 @@
+"""Offline export of the trained XGBoost model to its serving formats.
+
+Run this once after (re)training to regenerate ``xgb.onnx`` and
+``xgb_best_model.ubj`` from ``xgb_best_model.joblib``. The app serves
+predictions through onnxruntime, which avoids the per-click DMatrix
+construction of the XGBoost Python wrapper, and falls back to the
+native UBJSON booster — a schema-stable binary that loads much faster
+than the sklearn-wrapper pickle and survives XGBoost upgrades.
+
+Int8 quantization was evaluated and skipped: the exported graph is a
+single ai.onnx.ml TreeEnsembleClassifier node, which
+onnxruntime.quantization.quantize_dynamic rejects outright (it only
+rewrites MatMul/Gemm weights, none of which exist in a tree ensemble),
+so the fp32 artifact is already the smallest one available.
+
+Usage: python export_onnx.py
+"""
+
+import json
+
+import joblib
+import numpy as np
+import onnxmltools
+import onnxruntime as ort
+from onnxmltools.convert.common.data_types import FloatTensorType
+
+
+def main():
+    model = joblib.load("xgb_best_model.joblib")
+
+    with open("features.json") as f:
+        features = json.load(f)
+
+    # Native booster artifact for the app's non-ONNX fallback path
+    # (saved before the names are cleared below, so it keeps them).
+    model.get_booster().save_model("xgb_best_model.ubj")
+
+    # onnxmltools only accepts the default "f0, f1, ..." feature names,
+    # so clear the named features before converting.
+    model.get_booster().feature_names = None
+
+    initial_type = [("input", FloatTensorType([None, len(features)]))]
+    onnx_model = onnxmltools.convert_xgboost(model, initial_types=initial_type)
+    onnxmltools.utils.save_model(onnx_model, "xgb.onnx")
+
+    # Sanity check: the ONNX model must agree with the sklearn wrapper.
+    sess = ort.InferenceSession("xgb.onnx", providers=["CPUExecutionProvider"])
+    rng = np.random.default_rng(42)
+    x = rng.normal(5.0, 3.0, size=(100, len(features))).astype(np.float32)
+
+    labels, probs = sess.run(None, {"input": x})
+    ref_probs = model.predict_proba(x)[:, 1]
+    onnx_probs = np.array([p[1] for p in probs])
+
+    max_diff = np.abs(onnx_probs - ref_probs).max()
+    print(f"Saved xgb.onnx; max probability difference vs joblib model: {max_diff:.2e}")
+    assert max_diff < 1e-5, "ONNX model diverges from the original model"
+    assert (labels == model.predict(x)).all(), "ONNX labels diverge from the original model"
+
+
+if __name__ == "__main__":
+    main()